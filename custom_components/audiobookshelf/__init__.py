@@ -9,7 +9,7 @@ from homeassistant.const import CONF_API_KEY, CONF_SCAN_INTERVAL, CONF_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
-import aiohttp  # Import aiohttp
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.audiobookshelf.config_flow import validate_config
 from custom_components.audiobookshelf.const import (
@@ -17,7 +17,9 @@ from custom_components.audiobookshelf.const import (
     ISSUE_URL,
     PLATFORMS,
     VERSION,
-    HTTP_OK,
+)
+from custom_components.audiobookshelf.sensor import (
+    AudiobookshelfDataUpdateCoordinator,
 )
 
 CONFIG_SCHEMA = vol.Schema(
@@ -70,24 +72,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "Setting up Audiobookshelf with config: %s", clean_config(entry.data.copy())
     )
 
-    # Test the API connection here
-    conf = entry.data
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {conf[CONF_API_KEY]}"}
-            async with session.get(
-                f"{conf[CONF_URL]}/api/libraries", headers=headers
-            ) as response:
-                if response.status != HTTP_OK:
-                    msg = f"Failed to connect to Audiobookshelf API: {response.status}"
-                    _LOGGER.error(msg)
-                    raise ConfigEntryNotReady(msg)
-    except aiohttp.ClientError as e:
-        _LOGGER.error(f"Error connecting to Audiobookshelf API: {e}")
-        raise ConfigEntryNotReady(f"Error connecting to Audiobookshelf API: {e}")
-
     validate_config(entry.data.copy())
 
+    coordinator = AudiobookshelfDataUpdateCoordinator(hass, entry)
+    try:
+        libraries = await coordinator.get_libraries()
+    except UpdateFailed as e:
+        msg = f"Error connecting to Audiobookshelf API: {e}"
+        raise ConfigEntryNotReady(msg) from e
+    _LOGGER.debug("Retrieved %d libraries", len(libraries))
+    coordinator.generate_library_sensors(libraries)
+
+    # raises ConfigEntryNotReady itself if the first refresh fails
+    await coordinator.async_config_entry_first_refresh()
+    entry.runtime_data = coordinator
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -8,3 +8,7 @@ DOMAIN = "audiobookshelf"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 HTTP_OK = 200
 HTTP_AUTH_FAILURE = 401
+# responses larger than this are parsed in the executor to keep the loop free
+JSON_EXECUTOR_THRESHOLD = 64 * 1024
+# failed refreshes an endpoint may be served from its last good payload
+MAX_STALE_REFRESHES = 3
@@ -1,71 +1,65 @@
 # sensor.py
 """Module containing the sensor platform for the Audiobookshelf integration."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 import aiohttp
-from dacite import from_dict
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_SCAN_INTERVAL, CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
-
-from custom_components.audiobookshelf import clean_config
-from custom_components.audiobookshelf.const import DOMAIN, HTTP_OK, VERSION
+from homeassistant.util.json import json_loads
+
+from custom_components.audiobookshelf.const import (
+    DOMAIN,
+    HTTP_OK,
+    JSON_EXECUTOR_THRESHOLD,
+    MAX_STALE_REFRESHES,
+    VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def count_active_users(data: dict) -> int:
     """Take in an object with an array of users and counts the active ones."""
-    _LOGGER.debug("Entering count_active_users with data: %s", data)
-    count = 0
-    for user in data["users"]:
-        if user["isActive"] and user["username"] != "hass":
-            count += 1
-    _LOGGER.debug("Exiting count_active_users, returning: %s", count)
-    return count
+    return sum(
+        1 for user in data["users"] if user["isActive"] and user["username"] != "hass"
+    )
 
 
 def clean_user_attributes(data: dict) -> dict:
     """Remove the token and some extra data from users."""
-    _LOGGER.debug("Entering clean_user_attributes with data: %s", data)
     for user in data["users"]:
         user["token"] = "<redacted>"  # noqa: S105
-    _LOGGER.debug("Exiting clean_user_attributes, returning: %s", data)
     return data
 
 
 def count_open_sessions(data: dict) -> int:
     """Count the number of open stream sessions."""
-    _LOGGER.debug("Entering count_open_sessions with data: %s", data)
-    count = len(data.get("openSessions", []))
-    _LOGGER.debug("Exiting count_open_sessions, returning: %s", count)
-    return count
+    return len(data.get("openSessions", []))
 
 
 def count_libraries(data: dict) -> int:
     """Count the number libraries."""
-    _LOGGER.debug("Entering count_libraries with data: %s", data)
-    count = len(data["libraries"])
-    _LOGGER.debug("Exiting count_libraries, returning: %s", count)
-    return count
+    return len(data["libraries"])
 
 
 def extract_library_details(data: dict) -> dict:
     """Extract the details from the library."""
-    _LOGGER.debug("Entering extract_library_details with data: %s", data)
     details = {}
     for library in data.get("libraries", []):
         library_id = library.get("id")
@@ -74,79 +68,68 @@ def extract_library_details(data: dict) -> dict:
                 "mediaType": library.get("mediaType"),
                 "provider": library.get("provider"),
             }
-            _LOGGER.debug(
-                "Extracted details for library ID %s: %s",
-                library_id,
-                details[library_id],
-            )
         else:
             _LOGGER.warning("Library ID not found in library data: %s", library)
-    _LOGGER.debug("Exiting extract_library_details, returning: %s", details)
     return details
 
 
 def get_total_duration(total_duration: float | None) -> float | None:
     """Calculate the total duration in hours and round it to 0 decimal places."""
-    _LOGGER.debug("Entering get_total_duration with total_duration: %s", total_duration)
     if total_duration is None:
-        _LOGGER.debug("Total duration is None, returning None")
         return None
-    duration_hours = round(total_duration / 60.0 / 60.0, 0)
-    _LOGGER.debug("Calculated duration in hours: %s", duration_hours)
-    _LOGGER.debug("Exiting get_total_duration, returning: %s", duration_hours)
-    return duration_hours
+    return round(total_duration / 60.0 / 60.0, 0)
 
 
 def get_total_size(total_size: float | None) -> float | None:
     """Convert the size to human readable."""
-    _LOGGER.debug("Entering get_total_size with total_size: %s", total_size)
     if total_size is None:
-        _LOGGER.debug("Total size is None, returning None")
         return None
-    size_gb = round(total_size / 1024.0 / 1024.0 / 1024.0, 2)
-    _LOGGER.debug("Calculated size in GB: %s", size_gb)
-    _LOGGER.debug("Exiting get_total_size, returning: %s", size_gb)
-    return size_gb
+    return round(total_size / 1024.0 / 1024.0 / 1024.0, 2)
+
+
+def extract_total_size(data: dict) -> float | None:
+    """Extract the total size of a library from its stats."""
+    return get_total_size(data.get("totalSize"))
+
 
+def extract_total_items(data: dict) -> int | None:
+    """Extract the number of items in a library from its stats."""
+    return data.get("totalItems")
 
-def get_library_stats(data: dict) -> dict:
-    """Get statistics for each library."""
-    _LOGGER.debug("Entering get_library_stats with data: %s", data)
-    library_stats = extract_library_details(data)
-    _LOGGER.debug("Exiting get_library_stats, returning: %s", library_stats)
-    return library_stats
+
+def extract_total_duration(data: dict) -> float | None:
+    """Extract the total duration of a library from its stats."""
+    return get_total_duration(data.get("totalDuration"))
 
 
 def do_nothing(data: dict) -> dict:
     """Return the input data without any modifications."""
-    _LOGGER.debug("Entering do_nothing with data: %s", data)
-    _LOGGER.debug("Exiting do_nothing, returning input data")
     return data
 
 
 def extract_server_version(data: dict) -> str | None:
     """Extract the server version from the authorize endpoint."""
-    _LOGGER.debug("Entering extract_server_version with data: %s", data)
     try:
         version = data["serverSettings"]["version"]
         _LOGGER.debug("Extracted server version: %s", version)
-        _LOGGER.debug("Exiting extract_server_version, returning: %s", version)
         return version
     except KeyError:
         _LOGGER.warning("Server version not found in API response.")
-        _LOGGER.debug("Exiting extract_server_version, returning None")
         return None
 
 
 type Sensor = dict[str, Any]
 
+# coordinator data key holding library details derived once per refresh
+LIBRARY_DETAILS = "_derived_library_details"
+
 # simple polling sensors
 sensors: dict[str, Sensor] = {
     "users": {
         "endpoint": "api/users",
         "name": "Audiobookshelf Users",
         "data_function": count_active_users,
-        "attributes_function": clean_user_attributes,
+        "attributes_function": do_nothing,
         "unit": "users",
     },
     "sessions": {
@@ -160,7 +143,8 @@ sensors: dict[str, Sensor] = {
         "endpoint": "api/libraries",
         "name": "Audiobookshelf Libraries",
         "data_function": count_libraries,
-        "attributes_function": get_library_stats,
+        "attributes_endpoint": LIBRARY_DETAILS,
+        "attributes_function": do_nothing,
         "unit": "libraries",
     },
     "server_version": {
@@ -174,40 +158,18 @@ sensors: dict[str, Sensor] = {
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    _LOGGER.debug("Entering async_setup_entry")
-    conf = entry.data
-
-    _LOGGER.debug("Configuration data: %s", clean_config(conf.copy()))
-
-    coordinator = AudiobookshelfDataUpdateCoordinator(hass, entry)
-    _LOGGER.debug("AudiobookshelfDataUpdateCoordinator initialized: %s", coordinator)
-
-    try:
-        libraries: list[Library] = await coordinator.get_libraries()
-        _LOGGER.debug("Retrieved libraries: %s", libraries)
-        coordinator.generate_library_sensors(libraries)
-        _LOGGER.debug("Generated library sensors")
-
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("Initial data fetch completed")
-
-        entities = [
-            AudiobookshelfSensor(coordinator, sensor) for sensor in sensors.values()
-        ]
-        _LOGGER.debug("Created sensor entities: %s", entities)
-
-        _LOGGER.debug("Adding entities to Home Assistant: %s", entities)
-        async_add_entities(entities, update_before_add=True)
-        _LOGGER.debug("Exiting async_setup_entry")
-
-    except UpdateFailed as e:
-        _LOGGER.error("Error setting up sensor platform: %s", e)
-        raise ConfigEntryNotReady(f"Error setting up sensor platform: {e}") from e
+    coordinator: AudiobookshelfDataUpdateCoordinator = entry.runtime_data
+    entities = [
+        AudiobookshelfSensor(coordinator, sensor)
+        for sensor in coordinator.sensors.values()
+    ]
+    _LOGGER.debug("Adding %d sensor entities to Home Assistant", len(entities))
+    async_add_entities(entities)
 
 
 @dataclass
@@ -256,37 +218,55 @@ class Library:
     last_update: int | None
 
 
-def camel_to_snake(data: dict[str, Any] | list[Any]) -> dict[str, Any] | list[Any]:
-    """Convert camelCase keys to snake_case."""
-    _LOGGER.debug("Entering camel_to_snake with data: %s", data)
-
-    def _convert_key(key: str) -> str:
-        snake_case_key = "".join(
-            ["_" + char.lower() if char.isupper() else char for char in key]
-        ).lstrip("_")
-        _LOGGER.debug("Converted key '%s' to '%s'", key, snake_case_key)
-        return snake_case_key
-
-    if isinstance(data, dict):
-        converted_data = {
-            _convert_key(key): camel_to_snake(value)
-            if isinstance(value, (dict, list))
-            else value
-            for key, value in data.items()
-        }
-        _LOGGER.debug("Converted dictionary: %s", converted_data)
-        _LOGGER.debug("Exiting camel_to_snake, returning: %s", converted_data)
-        return converted_data
-    if isinstance(data, list):
-        converted_list = [
-            camel_to_snake(item) if isinstance(item, (dict, list)) else item
-            for item in data
+def _settings_from_json(settings: dict[str, Any] | None) -> LibrarySettings | None:
+    """Build library settings from the camelCase API representation."""
+    if settings is None:
+        return None
+    return LibrarySettings(
+        cover_aspect_ratio=settings.get("coverAspectRatio"),
+        disable_watcher=settings.get("disableWatcher"),
+        auto_scan_cron_expression=settings.get("autoScanCronExpression"),
+        skip_matching_media_with_asin=settings.get("skipMatchingMediaWithAsin"),
+        skip_matching_media_with_isbn=settings.get("skipMatchingMediaWithIsbn"),
+        audiobooks_only=settings.get("audiobooksOnly"),
+        epubs_allow_scripted_content=settings.get("epubsAllowScriptedContent"),
+        hide_single_book_series=settings.get("hideSingleBookSeries"),
+        only_show_later_books_in_continue_series=settings.get(
+            "onlyShowLaterBooksInContinueSeries"
+        ),
+        metadata_precedence=settings.get("metadataPrecedence"),
+        mark_as_finished_percent_complete=settings.get("markAsFinishedPercentComplete"),
+        mark_as_finished_time_remaining=settings.get("markAsFinishedTimeRemaining"),
+    )
+
+
+def _library_from_json(library: dict[str, Any]) -> Library:
+    """Build a library from the camelCase API representation."""
+    folders = library.get("folders")
+    return Library(
+        id=library["id"],
+        name=library["name"],
+        folders=[
+            LibraryFolder(
+                id=folder["id"],
+                full_path=folder.get("fullPath"),
+                library_id=folder["libraryId"],
+                added_at=folder.get("addedAt"),
+            )
+            for folder in folders
         ]
-        _LOGGER.debug("Converted list: %s", converted_list)
-        _LOGGER.debug("Exiting camel_to_snake, returning: %s", converted_list)
-        return converted_list
-    _LOGGER.debug("Exiting camel_to_snake, returning: %s", data)
-    return data
+        if folders is not None
+        else None,
+        display_order=library.get("displayOrder"),
+        icon=library.get("icon"),
+        media_type=library.get("mediaType"),
+        provider=library.get("provider"),
+        settings=_settings_from_json(library.get("settings")),
+        last_scan=library.get("lastScan"),
+        last_scan_version=library.get("lastScanVersion"),
+        created_at=library.get("createdAt"),
+        last_update=library.get("lastUpdate"),
+    )
 
 
 class AudiobookshelfDataUpdateCoordinator(DataUpdateCoordinator):
@@ -308,162 +288,186 @@ class AudiobookshelfDataUpdateCoordinator(DataUpdateCoordinator):
             name="audiobookshelf",
             update_interval=timedelta(seconds=self.conf[CONF_SCAN_INTERVAL]),
         )
+        self._session = async_get_clientsession(hass)
+        self._headers = {"Authorization": f"Bearer {self.conf[CONF_API_KEY]}"}
+        self._base_url = self.conf[CONF_URL].rstrip("/")
+        # last successful payload per endpoint, served on transient failures
+        self._last_good: dict[str, Any] = {}
+        # consecutive failed refreshes per endpoint
+        self._failures: dict[str, int] = {}
+        self._unavailable: set[str] = set()
+        # per entry copy so library sensors never leak into the module defaults
+        self.sensors: dict[str, Sensor] = sensors.copy()
+        self._unique_endpoints: frozenset[str] = frozenset(
+            sensor["endpoint"] for sensor in self.sensors.values()
+        )
         _LOGGER.debug("Exiting AudiobookshelfDataUpdateCoordinator.__init__")
 
     async def get_libraries(self) -> list[Library]:
-        """Fetch library id list from API."""
-        _LOGGER.debug("Entering AudiobookshelfDataUpdateCoordinator.get_libraries")
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self.conf[CONF_API_KEY]}"}
-            _LOGGER.debug("Headers for API request: %s", headers)
-            url = f"{self.conf[CONF_URL]}/api/libraries"
-            _LOGGER.debug("Fetching libraries from: %s", url)
-            try:
-                async with session.get(url, headers=headers) as response:
-                    _LOGGER.debug("Response status from API: %s", response.status)
-                    if response.status == HTTP_OK:
-                        data: dict[str, Any] = await response.json()
-                        _LOGGER.debug("Received library data: %s", data)
-                        libraries_data = data.get("libraries", [])
-                        _LOGGER.debug("Libraries data: %s", libraries_data)
-                        libraries = [
-                            from_dict(
-                                data_class=Library, data=(dict(camel_to_snake(lib)))
-                            )
-                            for lib in libraries_data
-                        ]
-                        _LOGGER.debug("Converted libraries: %s", libraries)
-                        _LOGGER.debug(
-                            "Exiting AudiobookshelfDataUpdateCoordinator.get_libraries, returning %s",
-                            libraries,
-                        )
-                        return libraries
-                    else:
-                        _LOGGER.error(
-                            "Failed to fetch libraries, status: %s", response.status
-                        )
-                        _LOGGER.debug(
-                            "Exiting AudiobookshelfDataUpdateCoordinator.get_libraries, returning empty list"
-                        )
-                        return []
-            except aiohttp.ClientError as e:
-                _LOGGER.error("AIOHTTP error fetching libraries: %s", e)
-                _LOGGER.debug(
-                    "Exiting AudiobookshelfDataUpdateCoordinator.get_libraries, returning empty list"
-                )
-                return []
+        """Fetch library id list from API, raising UpdateFailed if unreachable."""
+        url = f"{self._base_url}/api/libraries"
+        _LOGGER.debug("Fetching libraries from: %s", url)
+        try:
+            async with self._session.get(url, headers=self._headers) as response:
+                _LOGGER.debug("Response status from API: %s", response.status)
+                if response.status == HTTP_OK:
+                    raw = await response.read()
+                    _LOGGER.debug("Received library data: %d bytes", len(raw))
+                    data: dict[str, Any] = await self._parse_json(raw)
+                    libraries_data = data.get("libraries", [])
+                    libraries = [_library_from_json(lib) for lib in libraries_data]
+                    _LOGGER.debug("Converted %d libraries", len(libraries))
+                    return libraries
+                error_message = f"Failed to fetch libraries, status: {response.status}"
+                _LOGGER.error(error_message)
+                raise UpdateFailed(error_message)
+        except aiohttp.ClientError as e:
+            _LOGGER.error("AIOHTTP error fetching libraries: %s", e)
+            msg = f"Error fetching libraries: {e}"
+            raise UpdateFailed(msg) from e
 
     def generate_library_sensors(self, libraries: list[Library]) -> None:
         """Generate sensor configs for each library."""
-        _LOGGER.debug(
-            "Entering AudiobookshelfDataUpdateCoordinator.generate_library_sensors with libraries: %s",
-            libraries,
-        )
         for library in libraries:
             base_id = f"library_{library.id}"
-            sensors.update(
+            # all three sensors read the same stats payload, fetched once per refresh
+            stats_endpoint = f"api/libraries/{library.id}/stats"
+            self.sensors.update(
                 {
                     f"{base_id}_size": {
-                        "endpoint": f"api/libraries/{library.id}/stats",
+                        "endpoint": stats_endpoint,
                         "name": f"Audiobookshelf {library.name} Size",
                         "unique_id": f"{base_id}_size",
-                        "data_function": lambda data: get_total_size(
-                            data.get("totalSize")
-                        ),
+                        "data_function": extract_total_size,
                         "unit": "GB",
                         "attributes_function": do_nothing,
                     },
                     f"{base_id}_items": {
-                        "endpoint": f"api/libraries/{library.id}/stats",
+                        "endpoint": stats_endpoint,
                         "name": f"Audiobookshelf {library.name} Items",
                         "unique_id": f"{base_id}_items",
-                        "data_function": lambda data: data.get("totalItems"),
+                        "data_function": extract_total_items,
                         "unit": "items",
                         "attributes_function": do_nothing,
                     },
                     f"{base_id}_duration": {
-                        "endpoint": f"api/libraries/{library.id}/stats",
+                        "endpoint": stats_endpoint,
                         "name": f"Audiobookshelf {library.name} Duration",
                         "unique_id": f"{base_id}_duration",
-                        "data_function": lambda data: get_total_duration(
-                            data.get("totalDuration")
-                        ),
+                        "data_function": extract_total_duration,
                         "unit": "hours",
                         "attributes_function": do_nothing,
                     },
                 }
             )
+        self._unique_endpoints = frozenset(
+            sensor["endpoint"] for sensor in self.sensors.values()
+        )
         _LOGGER.debug(
-            "Exiting AudiobookshelfDataUpdateCoordinator.generate_library_sensors, updated sensors: %s",
-            sensors,
+            "Generated sensors for %d libraries, %d sensors in total",
+            len(libraries),
+            len(self.sensors),
         )
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from API endpoint."""
-        _LOGGER.debug("Entering AudiobookshelfDataUpdateCoordinator._async_update_data")
-        headers = {"Authorization": f"Bearer {self.conf[CONF_API_KEY]}"}
-        data = {}
-        unique_endpoints: set[str] = {sensor["endpoint"] for sensor in sensors.values()}
-        _LOGGER.debug("Fetching data for unique endpoints: %s", unique_endpoints)
+    async def _parse_json(self, raw: bytes) -> Any:
+        """Parse a response body, off the event loop if it is large."""
+        if len(raw) > JSON_EXECUTOR_THRESHOLD:
+            return await self.hass.async_add_executor_job(json_loads, raw)
+        return json_loads(raw)
+
+    async def _fetch(self, endpoint: str) -> dict:
+        """Fetch data from a single API endpoint."""
+        url = f"{self._base_url}/{endpoint}"
+        # the authorize endpoint only accepts POST
+        method = "POST" if endpoint == "api/authorize" else "GET"
+        _LOGGER.debug("Fetching data from: %s (%s)", url, method)
         try:
-            async with aiohttp.ClientSession() as session:
-                for endpoint in unique_endpoints:
-                    url = f"{self.conf[CONF_URL]}/{endpoint}"
-                    _LOGGER.debug("Fetching data from: %s", url)
-                    try:
-                        if endpoint == "api/authorize":
-                            async with session.post(
-                                url, headers=headers
-                            ) as response:  # Changed to POST
-                                _LOGGER.debug(
-                                    "Response status for %s (POST): %s",
-                                    endpoint,
-                                    response.status,
-                                )
-                                if response.status != HTTP_OK:
-                                    error_message = f"Error fetching data for {endpoint}: {response.status}"
-                                    _LOGGER.error(error_message)
-                                    raise UpdateFailed(error_message)
-                                response_data = await response.json()
-                                data[endpoint] = response_data
-                                _LOGGER.debug(
-                                    "Data received for %s: %s", endpoint, response_data
-                                )
-
-                        else:
-                            async with session.get(url, headers=headers) as response:
-                                _LOGGER.debug(
-                                    "Response status for %s (GET): %s",
-                                    endpoint,
-                                    response.status,
-                                )
-                                if response.status != HTTP_OK:
-                                    error_message = f"Error fetching data for {endpoint}: {response.status}"
-                                    _LOGGER.error(error_message)
-                                    raise UpdateFailed(error_message)
-                                response_data = await response.json()
-                                data[endpoint] = response_data
-                                _LOGGER.debug(
-                                    "Data received for %s: %s", endpoint, response_data
-                                )
-
-                    except aiohttp.ClientError as e:
-                        _LOGGER.error("AIOHTTP error fetching %s: %s", endpoint, e)
-                        raise UpdateFailed(f"Error fetching data for {endpoint}: {e}")
-            _LOGGER.debug(
-                "Exiting AudiobookshelfDataUpdateCoordinator._async_update_data, returning data: %s",
-                data,
-            )
-            return data
-        except UpdateFailed as err:
-            _LOGGER.error("Error during data update: %s", err)
-            _LOGGER.debug(
-                "Exiting AudiobookshelfDataUpdateCoordinator._async_update_data with failure"
+            async with self._session.request(
+                method, url, headers=self._headers
+            ) as response:
+                _LOGGER.debug(
+                    "Response status for %s (%s): %s",
+                    endpoint,
+                    method,
+                    response.status,
+                )
+                if response.status != HTTP_OK:
+                    error_message = (
+                        f"Error fetching data for {endpoint}: {response.status}"
+                    )
+                    raise UpdateFailed(error_message)
+                raw = await response.read()
+                _LOGGER.debug("Data received for %s: %d bytes", endpoint, len(raw))
+                response_data = await self._parse_json(raw)
+                # redact tokens once, before the payload is cached
+                if endpoint == "api/users":
+                    response_data = clean_user_attributes(response_data)
+                return response_data
+        except aiohttp.ClientError as e:
+            msg = f"Error fetching data for {endpoint}: {e}"
+            raise UpdateFailed(msg) from e
+
+    def _handle_failed_endpoint(
+        self, endpoint: str, error: Exception, data: dict[str, Any]
+    ) -> None:
+        """Serve the last good payload for a failed endpoint while it is fresh."""
+        failures = self._failures.get(endpoint, 0) + 1
+        self._failures[endpoint] = failures
+        if endpoint in self._last_good and failures <= MAX_STALE_REFRESHES:
+            _LOGGER.warning(
+                "Using last known data for %s after error (%d/%d): %s",
+                endpoint,
+                failures,
+                MAX_STALE_REFRESHES,
+                error,
             )
-            raise
-
+            data[endpoint] = self._last_good[endpoint]
+            return
+        self._last_good.pop(endpoint, None)
+        # log the outage once, its sensors report unavailable until it recovers
+        if endpoint in self._unavailable:
+            _LOGGER.debug("Error fetching %s: %s", endpoint, error)
+        else:
+            _LOGGER.error("Error fetching %s: %s", endpoint, error)
+            self._unavailable.add(endpoint)
 
-class AudiobookshelfSensor(RestoreEntity, Entity):
+    async def _async_update_data(self) -> dict:
+        """Fetch data from API endpoint."""
+        unique_endpoints = self._unique_endpoints
+        _LOGGER.debug("Fetching data for unique endpoints: %s", unique_endpoints)
+        results = await asyncio.gather(
+            *(self._fetch(endpoint) for endpoint in unique_endpoints),
+            return_exceptions=True,
+        )
+        data: dict[str, Any] = {}
+        errors: list[Exception] = []
+        for endpoint, result in zip(unique_endpoints, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    # cancellation and interpreter exit are not endpoint failures
+                    raise result
+                errors.append(result)
+                self._handle_failed_endpoint(endpoint, result, data)
+                continue
+            self._failures.pop(endpoint, None)
+            if endpoint in self._unavailable:
+                _LOGGER.info("Data for %s is available again", endpoint)
+                self._unavailable.discard(endpoint)
+            self._last_good[endpoint] = result
+            data[endpoint] = result
+        if errors and len(errors) == len(unique_endpoints):
+            if isinstance(errors[0], UpdateFailed):
+                raise errors[0]
+            msg = f"Error fetching data: {errors[0]}"
+            raise UpdateFailed(msg) from errors[0]
+        if "api/libraries" in data:
+            data[LIBRARY_DETAILS] = extract_library_details(data["api/libraries"])
+        return data
+
+
+class AudiobookshelfSensor(
+    CoordinatorEntity[AudiobookshelfDataUpdateCoordinator], RestoreEntity
+):
     """Representation of a sensor."""
 
     def __init__(
@@ -471,15 +475,16 @@ class AudiobookshelfSensor(RestoreEntity, Entity):
     ) -> None:
         """Initialize the sensor."""
         _LOGGER.debug("Entering AudiobookshelfSensor.__init__ with sensor: %s", sensor)
+        super().__init__(coordinator)
         self._name = sensor["name"]
         self._unique_id = sensor.get("unique_id", self._name)
         self._attr_unit_of_measurement = sensor.get("unit", None)
         self._endpoint = sensor["endpoint"]
-        self.coordinator = coordinator
         self._state: str | None = None
         self._attr_extra_state_attributes = {}
         self._process_data = sensor["data_function"]
         self._process_attributes = sensor["attributes_function"]
+        self._attributes_endpoint = sensor.get("attributes_endpoint", self._endpoint)
         self.conf = self.coordinator.conf
         _LOGGER.debug("Exiting AudiobookshelfSensor.__init__")
 
@@ -497,11 +502,14 @@ class AudiobookshelfSensor(RestoreEntity, Entity):
                 "Restored state: %s, attributes: %s", self._state, self._attributes
             )
 
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
+        self._update_from_coordinator()
         _LOGGER.debug("Exiting AudiobookshelfSensor.async_added_to_hass")
 
+    @property
+    def available(self) -> bool:
+        """Return if the sensor's endpoint has data in the last refresh."""
+        return super().available and self._endpoint in (self.coordinator.data or {})
+
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
@@ -534,30 +542,36 @@ class AudiobookshelfSensor(RestoreEntity, Entity):
         # Create unique IDs for each sensor that include the API URL
         return f"{self.conf[CONF_URL]}_{self._endpoint}_{self._name}"
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        _LOGGER.debug("Entering AudiobookshelfSensor.async_update")
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Process the latest coordinator data into state and attributes."""
         data = self.coordinator.data
-        if data:
-            endpoint_data = data.get(self._endpoint, {})
-            _LOGGER.debug("Data for endpoint %s: %s", self._endpoint, endpoint_data)
-            if isinstance(endpoint_data, dict):
-                processed_attributes = self._process_attributes(endpoint_data)
-                self._attr_extra_state_attributes.update(processed_attributes)
-                _LOGGER.debug(
-                    "Updated extra state attributes: %s",
-                    self._attr_extra_state_attributes,
-                )
-                new_state = self._process_data(data=endpoint_data)
-                _LOGGER.debug("Calculated new state: %s", new_state)
-                if new_state not in (0, None) or self._state in (0, None):
-                    self._state = new_state
-                    _LOGGER.debug("Sensor state updated to: %s", self._state)
-            else:
-                _LOGGER.error(
-                    "Expected endpoint_data to be a dictionary for %s, got %s",
-                    self._endpoint,
-                    type(endpoint_data),
-                )
-                _LOGGER.debug("Data: %s", endpoint_data)
-        _LOGGER.debug("Exiting AudiobookshelfSensor.async_update")
+        endpoint_data = data.get(self._endpoint) if data else None
+        if endpoint_data is None:
+            # endpoint is down, keep the state while the sensor reports unavailable
+            return
+        if not isinstance(endpoint_data, dict):
+            _LOGGER.error(
+                "Expected endpoint_data to be a dictionary for %s, got %s",
+                self._endpoint,
+                type(endpoint_data),
+            )
+            return
+        attributes_data = (
+            endpoint_data
+            if self._attributes_endpoint == self._endpoint
+            else data.get(self._attributes_endpoint, {})
+        )
+        self._attr_extra_state_attributes.update(
+            self._process_attributes(attributes_data)
+        )
+        new_state = self._process_data(data=endpoint_data)
+        _LOGGER.debug("Calculated new state: %s", new_state)
+        if new_state not in (0, None) or self._state in (0, None):
+            self._state = new_state
+            _LOGGER.debug("Sensor state updated to: %s", self._state)
@@ -1,188 +1,207 @@
 """
 Test module for the audiobookshelf sensor component.
 
-This module contains test cases for the camel_to_snake function used in the
-audiobookshelf sensor component.
+This module contains test cases for the _library_from_json function and the
+data update coordinator used in the audiobookshelf sensor component.
 """
 
-from custom_components.audiobookshelf.sensor import camel_to_snake
+import asyncio
+import json
+from typing import Any, Self
+from unittest.mock import MagicMock
 
+import pytest
+from homeassistant.const import CONF_API_KEY, CONF_SCAN_INTERVAL, CONF_URL
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-def test_camel_to_snake_with_dict() -> None:
-    """
-    Test the camel_to_snake function with a dictionary input.
+from custom_components.audiobookshelf import sensor
+from custom_components.audiobookshelf.const import MAX_STALE_REFRESHES
+from custom_components.audiobookshelf.sensor import (
+    AudiobookshelfDataUpdateCoordinator,
+    Library,
+    LibraryFolder,
+    _library_from_json,
+)
 
-    This test verifies that the camel_to_snake function correctly converts
-    dictionary keys from camelCase to snake_case format, including nested
-    dictionaries.
+HTTP_FORBIDDEN = 403
 
-    The test data includes:
-    - A simple dictionary with a camelCase key
-    - A nested dictionary with camelCase keys at both levels
 
-    Expected behavior:
-    - All dictionary keys should be converted from camelCase to snake_case
-    - Dictionary values should remain unchanged
-    - The nested structure should be preserved
-
-    Returns:
-        None
+class StubResponse:
+    """Response returned by StubSession, usable as an async context manager."""
 
-    Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
-        expected output
+    def __init__(self, status: int, payload: dict[str, Any]) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._payload = payload
 
-    """
-    data = {
-        "camelCaseKey": "value",
-        "nestedCamelCase": {"innerCamelCaseKey": "innerValue"},
-    }
-    expected = {
-        "camel_case_key": "value",
-        "nested_camel_case": {"inner_camel_case_key": "innerValue"},
-    }
-    assert camel_to_snake(data) == expected
+    async def __aenter__(self) -> Self:
+        """Enter the response context."""
+        return self
 
+    async def __aexit__(self, *_: object) -> None:
+        """Exit the response context."""
 
-def test_camel_to_snake_with_list_of_dicts() -> None:
-    """
-    Test the camel_to_snake function with a list of dictionaries.
+    async def read(self) -> bytes:
+        """Return the encoded payload."""
+        return json.dumps(self._payload).encode()
 
-    This test verifies that the camel_to_snake function correctly converts
-    dictionary keys from camelCase to snake_case format, including nested
-    dictionaries.
 
-    The test data includes:
-    - A list of dictionaries with camelCase keys
+class StubSession:
+    """Session answering each endpoint with a configurable status."""
 
-    Expected behavior:
-    - All dictionary keys should be converted from camelCase to snake_case
-    - Dictionary values should remain unchanged
-    - The nested structure should be preserved
+    def __init__(self) -> None:
+        """Initialize the session with every endpoint succeeding."""
+        self.statuses: dict[str, int] = {}
 
-    Returns:
-        None
+    def request(self, _method: str, url: str, **_: Any) -> StubResponse:
+        """Return a response for the endpoint part of the url."""
+        endpoint = url.removeprefix("http://abs.local/")
+        status = self.statuses.get(endpoint, 200)
+        return StubResponse(status, {"endpoint": endpoint})
 
-    Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
-        expected output
 
-    """
-    data = [{"camelCaseKey": "value"}, {"anotherCamelCaseKey": "anotherValue"}]
-    expected = [{"camel_case_key": "value"}, {"another_camel_case_key": "anotherValue"}]
-    assert camel_to_snake(data) == expected
+def make_coordinator(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[AudiobookshelfDataUpdateCoordinator, StubSession]:
+    """Create a coordinator polling two endpoints through a stub session."""
+    session = StubSession()
+    monkeypatch.setattr(sensor, "async_get_clientsession", lambda _hass: session)
+    entry = MagicMock()
+    entry.data = {
+        CONF_URL: "http://abs.local",
+        CONF_API_KEY: "key",
+        CONF_SCAN_INTERVAL: 300,
+    }
+    coordinator = AudiobookshelfDataUpdateCoordinator(MagicMock(), entry)
+    coordinator._unique_endpoints = frozenset({"api/users/online", "api/authorize"})  # noqa: SLF001
+    return coordinator, session
 
 
-def test_camel_to_snake_with_mixed_list() -> None:
+def test_library_from_json() -> None:
     """
-    Test the camel_to_snake function with a mixed list input.
+    Test the _library_from_json function with an API library payload.
 
-    This test verifies that the camel_to_snake function correctly handles a complex
-    nested structure containing both dictionaries and lists, where dictionary keys
-    need to be converted from camelCase to snake_case format.
+    This test verifies that the _library_from_json function builds a Library
+    directly from the camelCase API representation.
 
     The test data includes:
-    - A dictionary with a camelCase key
-    - A nested list containing a string and another dictionary with a camelCase key
+    - A library with one folder and no settings
 
     Expected behavior:
-    - Dictionary keys should be converted from camelCase to snake_case
-    - List items that are strings should remain unchanged
-    - The structure of the input should be preserved
+    - camelCase fields should be mapped onto the snake_case dataclass fields
+    - Missing optional fields should be None
 
     Returns:
         None
 
     Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
+        AssertionError: If the _library_from_json function output doesn't match
         expected output
 
     """
-    data = [
-        {"camelCaseKey": "value"},
-        ["nestedListCamelCase", {"innerCamelCaseKey": "innerValue"}],
-    ]
-    expected = [
-        {"camel_case_key": "value"},
-        ["nestedListCamelCase", {"inner_camel_case_key": "innerValue"}],
-    ]
-    assert camel_to_snake(data) == expected
-
-
-def test_camel_to_snake_with_empty_dict() -> None:
+    data = {
+        "id": "lib_1",
+        "name": "Audiobooks",
+        "folders": [
+            {
+                "id": "fol_1",
+                "fullPath": "/audiobooks",
+                "libraryId": "lib_1",
+                "addedAt": 1700000000000,
+            }
+        ],
+        "mediaType": "book",
+        "provider": "audible",
+    }
+    expected = Library(
+        id="lib_1",
+        name="Audiobooks",
+        folders=[
+            LibraryFolder(
+                id="fol_1",
+                full_path="/audiobooks",
+                library_id="lib_1",
+                added_at=1700000000000,
+            )
+        ],
+        display_order=None,
+        icon=None,
+        media_type="book",
+        provider="audible",
+        settings=None,
+        last_scan=None,
+        last_scan_version=None,
+        created_at=None,
+        last_update=None,
+    )
+    assert _library_from_json(data) == expected
+
+
+def test_update_serves_cached_data_for_failed_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """
-    Test the camel_to_snake function with an empty dictionary.
-
-    This test verifies that the camel_to_snake function correctly handles
-    empty dictionaries.
-
-    The test data includes:
-    - Empty dictionary
+    Test that a failed endpoint falls back to its last good payload.
 
-    Expected behavior:
-    - Empty dictionary should be unchanged
+    The cached payload is served for a bounded number of failed refreshes,
+    after which the endpoint is left out of the data.
 
     Returns:
         None
 
     Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
-        expected output
+        AssertionError: If the coordinator data doesn't match expected output
 
     """
-    data = {}
-    expected = {}
-    assert camel_to_snake(data) == expected
+    coordinator, session = make_coordinator(monkeypatch)
+    data = asyncio.run(coordinator._async_update_data())  # noqa: SLF001
+    assert data["api/authorize"] == {"endpoint": "api/authorize"}
 
+    session.statuses["api/authorize"] = HTTP_FORBIDDEN
+    for _ in range(MAX_STALE_REFRESHES):
+        data = asyncio.run(coordinator._async_update_data())  # noqa: SLF001
+        assert data["api/authorize"] == {"endpoint": "api/authorize"}
 
-def test_camel_to_snake_with_empty_list() -> None:
-    """
-    Test the camel_to_snake function with an empty list.
-
-    This test verifies that the camel_to_snake function correctly handles
-    empty lists.
+    data = asyncio.run(coordinator._async_update_data())  # noqa: SLF001
+    assert "api/authorize" not in data
+    assert data["api/users/online"] == {"endpoint": "api/users/online"}
 
-    The test data includes:
-    - Empty list
 
-    Expected behavior:
-    - Empty list should be unchanged
+def test_update_omits_failed_endpoint_without_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a failed endpoint with no cached payload is left out.
 
     Returns:
         None
 
     Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
-        expected output
+        AssertionError: If the coordinator data doesn't match expected output
 
     """
-    data = []
-    expected = []
-    assert camel_to_snake(data) == expected
+    coordinator, session = make_coordinator(monkeypatch)
+    session.statuses["api/authorize"] = HTTP_FORBIDDEN
+    data = asyncio.run(coordinator._async_update_data())  # noqa: SLF001
+    assert "api/authorize" not in data
+    assert data["api/users/online"] == {"endpoint": "api/users/online"}
 
 
-def test_camel_to_snake_with_non_camel_case() -> None:
+def test_update_fails_when_all_endpoints_fail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """
-    Test the camel_to_snake function with dictionary with mixed keys.
-
-    This test verifies that the camel_to_snake function correctly handles
-    already snake_case keys alongside camelCase keys.
-
-    The test data includes:
-    - Simple dictionary with camelCase and snake_case
-
-    Expected behavior:
-    - snake_case keys should be unchanged
-    - camelCase keys should be updated
+    Test that the refresh fails when every endpoint fails.
 
     Returns:
         None
 
     Raises:
-        AssertionError: If the camel_to_snake function output doesn't match
-        expected output
+        AssertionError: If UpdateFailed is not raised
 
     """
-    data = {"snake_case_key": "value", "PascalCaseKey": "value"}
-    expected = {"snake_case_key": "value", "pascal_case_key": "value"}
-    assert camel_to_snake(data) == expected
+    coordinator, session = make_coordinator(monkeypatch)
+    session.statuses["api/authorize"] = HTTP_FORBIDDEN
+    session.statuses["api/users/online"] = HTTP_FORBIDDEN
+    with pytest.raises(UpdateFailed):
+        asyncio.run(coordinator._async_update_data())  # noqa: SLF001